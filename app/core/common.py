@@ -8,25 +8,39 @@ This module provides utilities for:
 
 import os
 import json
+import queue
+import atexit
 import logging
-from typing import Dict, List, Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional
 from datetime import timedelta
+from functools import lru_cache
 import time
 
 def setup_logging() -> None:
     """Configure logging for the application.
     
     Sets up logging to both console and file with appropriate format
-    and log level.
+    and log level. Records are handed to a queue and written by a
+    background listener so that console and file I/O stay off the
+    calling thread.
     """
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue,
+        logging.StreamHandler(),
+        logging.FileHandler('tcdata.log', delay=True)
+    )
+    queue_handler = QueueHandler(log_queue)
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('tcdata.log')
-        ]
+        handlers=[queue_handler]
     )
+    # basicConfig is a no-op when logging is already configured
+    if queue_handler in logging.getLogger().handlers:
+        listener.start()
+        atexit.register(listener.stop)
 
 def find_config_directory(directories: List[str]) -> Optional[str]:
     """Find the first valid configuration directory from a list of candidates.
@@ -72,6 +86,36 @@ def load_config(config_directories: List[str]) -> Optional[Dict]:
             
     return config
 
+@lru_cache(maxsize=4)
+def _read_api_keys_file(path: str, mtime_ns: int) -> Any:
+    """Parse an API keys file, cached per path and modification time.
+    
+    Args:
+        path: Path to the JSON API keys file
+        mtime_ns: Modification time of the file, so edits miss the cache
+        
+    Returns:
+        Any: Parsed JSON content of the file
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def load_api_keys_file(path: str) -> Any:
+    """Load an API keys file, re-reading it only after it changes.
+    
+    Args:
+        path: Path to the JSON API keys file
+        
+    Returns:
+        Any: Parsed JSON content; dicts are copied so callers may modify them
+        
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file does not contain valid JSON
+    """
+    api_keys = _read_api_keys_file(path, os.stat(path).st_mtime_ns)
+    return dict(api_keys) if isinstance(api_keys, dict) else api_keys
+
 def parse_iso_duration(duration: str) -> timedelta:
     """Parse an ISO 8601 duration string into a timedelta object.
     
@@ -79,6 +123,9 @@ def parse_iso_duration(duration: str) -> timedelta:
     into a Python timedelta object. Note that years and months are converted to days
     (365 days for a year, 30 days for a month).
     
+    Results are cached per duration string, since the polling loop parses the
+    same handful of frequencies over and over. Invalid strings are not cached.
+    
     Args:
         duration: ISO 8601 duration string (e.g., "PT15M", "PT1H", "P1D")
         
@@ -96,86 +143,71 @@ def parse_iso_duration(duration: str) -> timedelta:
         >>> parse_iso_duration("P1D")
         timedelta(days=1)
     """
+    # Checked before the cache lookup, which would reject unhashable
+    # arguments with a TypeError
     if not isinstance(duration, str):
         raise ValueError(f"Duration must be a string, got {type(duration)}")
-    
-    if not duration or not duration.startswith('P'):
+    return _parse_iso_duration(duration)
+
+@lru_cache(maxsize=128)
+def _parse_iso_duration(duration: str) -> timedelta:
+    """Parse a duration string for parse_iso_duration, cached per string."""
+    if not duration or duration[0] != 'P':
         raise ValueError(f"Invalid duration format: {duration}. Must start with 'P'")
     
-    duration = duration[1:]  # Remove P
-    
     # Initialize timedelta components
     days = 0
     hours = 0
     minutes = 0
     seconds = 0
     
-    # Split into date and time parts if T is present
-    if 'T' in duration:
-        date_part, time_part = duration.split('T')
-    else:
-        date_part = duration
-        time_part = ''
-    
-    # Parse date part
-    remaining_date = date_part
-    if date_part:
-        # Years
-        if 'Y' in remaining_date:
-            parts = remaining_date.split('Y')
-            if len(parts) != 2 or not parts[0].isdigit():
-                raise ValueError(f"Invalid years format in duration: {duration}")
-            days += int(parts[0]) * 365
-            remaining_date = parts[1]
-        
-        # Months
-        if 'M' in remaining_date:
-            parts = remaining_date.split('M')
-            if len(parts) != 2 or not parts[0].isdigit():
-                raise ValueError(f"Invalid months format in duration: {duration}")
-            days += int(parts[0]) * 30
-            remaining_date = parts[1]
-        
-        # Days
-        if 'D' in remaining_date:
-            parts = remaining_date.split('D')
-            if len(parts) != 2 or not parts[0].isdigit():
-                raise ValueError(f"Invalid days format in duration: {duration}")
-            days += int(parts[0])
-            remaining_date = parts[1]
+    # Single forward scan: accumulate digits, dispatch on each designator.
+    # Designators must appear in Y, M, D order before 'T' and H, M, S after it.
+    num = None
+    in_time = False
+    units = 'YMD'
+    unit_pos = 0
+    for c in duration[1:]:
+        if '0' <= c <= '9':
+            num = (num or 0) * 10 + (ord(c) - 48)
+            continue
         
-        if remaining_date:
-            raise ValueError(f"Invalid date format in duration: {duration}")
-    
-    # Parse time part
-    remaining_time = time_part
-    if time_part:
-        # Hours
-        if 'H' in remaining_time:
-            parts = remaining_time.split('H')
-            if len(parts) != 2 or not parts[0].isdigit():
-                raise ValueError(f"Invalid hours format in duration: {duration}")
-            hours = int(parts[0])
-            remaining_time = parts[1]
+        if c == 'T':
+            if in_time or num is not None:
+                raise ValueError(f"Invalid time designator in duration: {duration}")
+            in_time = True
+            units = 'HMS'
+            unit_pos = 0
+            continue
         
-        # Minutes
-        if 'M' in remaining_time:
-            parts = remaining_time.split('M')
-            if len(parts) != 2 or not parts[0].isdigit():
-                raise ValueError(f"Invalid minutes format in duration: {duration}")
-            minutes = int(parts[0])
-            remaining_time = parts[1]
+        pos = units.find(c, unit_pos)
+        if pos < 0:
+            part = 'time' if in_time else 'date'
+            raise ValueError(f"Invalid {part} format in duration: {duration}")
+        if num is None:
+            raise ValueError(f"Missing value for '{c}' in duration: {duration}")
         
-        # Seconds
-        if 'S' in remaining_time:
-            parts = remaining_time.split('S')
-            if len(parts) != 2 or not parts[0].isdigit():
-                raise ValueError(f"Invalid seconds format in duration: {duration}")
-            seconds = int(parts[0])
-            remaining_time = parts[1]
+        if not in_time:
+            if c == 'Y':
+                days += num * 365
+            elif c == 'M':
+                days += num * 30
+            else:
+                days += num
+        elif c == 'H':
+            hours = num
+        elif c == 'M':
+            minutes = num
+        else:
+            seconds = num
         
-        if remaining_time:
-            raise ValueError(f"Invalid time format in duration: {duration}")
+        unit_pos = pos + 1
+        num = None
+    
+    if num is not None:
+        raise ValueError(f"Missing designator after value in duration: {duration}")
+    if in_time and unit_pos == 0:
+        raise ValueError(f"Invalid time format in duration: {duration}")
     
     # Ensure at least one valid component was found
     if days == 0 and hours == 0 and minutes == 0 and seconds == 0:
@@ -183,12 +215,17 @@ def parse_iso_duration(duration: str) -> timedelta:
     
     return timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
 
+# Monotonic time of the most recent poll deadline, keyed by endpoint name
+_poll_deadlines: Dict[str, float] = {}
+
 def wait_for_next_poll(api_config: Dict) -> None:
     """Wait until the next polling interval based on the endpoint's frequency.
     
     This function calculates the next polling time based on the endpoint's frequency
     and waits until that time. It uses the ISO 8601 duration format to determine
-    the interval.
+    the interval. Deadlines are tracked on the monotonic clock, so time spent
+    processing between calls is deducted from the next wait instead of
+    accumulating as drift.
     
     Args:
         api_config: API endpoint configuration dictionary containing the frequency
@@ -205,11 +242,21 @@ def wait_for_next_poll(api_config: Dict) -> None:
     
     try:
         interval = parse_iso_duration(frequency)
-        interval_seconds = int(interval.total_seconds())  # Convert to integer seconds
+        interval_seconds = interval.total_seconds()
+        
+        name = api_config['name']
+        now = time.monotonic()
+        last_deadline = _poll_deadlines.get(name)
+        if last_deadline is None:
+            delay = interval_seconds
+        else:
+            # Never try to catch up on polls that are already overdue
+            delay = max(last_deadline + interval_seconds - now, 0.0)
+        _poll_deadlines[name] = now + delay
         
-        if interval_seconds > 0:
-            logging.info("Waiting %d seconds until next poll for %s", 
-                        interval_seconds, api_config['name'])
-            time.sleep(interval_seconds)
+        if delay > 0:
+            logging.info("Waiting %.1f seconds until next poll for %s", 
+                        delay, name)
+            time.sleep(delay)
     except ValueError as e:
         raise ValueError(f"Invalid frequency format '{frequency}' for endpoint {api_config['name']}: {str(e)}")
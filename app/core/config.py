@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
+from app.core.common import load_api_keys_file
+
 @dataclass
 class GoogleConfig:
     """Google Cloud configuration settings."""
@@ -46,8 +48,8 @@ class TornConfig:
             raise FileNotFoundError(f"Torn API key file not found: {api_key_file}")
             
         try:
-            with open(api_key_file) as f:
-                api_keys = json.load(f)
+            # Shares the parsed file with the processors' TornClient instances
+            api_keys = load_api_keys_file(str(api_key_file))
             
             return cls(
                 api_key=api_keys['default'],
@@ -11,11 +11,70 @@ It handles:
 import sys
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Any, Dict
 
 from app.core.config import Config
 from app.services.torncity.registry import EndpointRegistry
 
+def build_processor_config(config: Config, endpoint_name: str) -> Dict[str, Any]:
+    """Build the processor configuration for an endpoint.
+    
+    Args:
+        config: Loaded application configuration
+        endpoint_name: Name of the endpoint in TC_API_config.json
+        
+    Returns:
+        Dict[str, Any]: Configuration dictionary for the endpoint processor
+    """
+    endpoint_config = config.endpoints[endpoint_name]
+    return {
+        'gcp_credentials_file': str(config.config_dir / 'credentials.json'),
+        'endpoint': endpoint_name,
+        'storage_mode': endpoint_config.get('storage_mode', 'append'),
+        'tc_api_key_file': str(config.config_dir / 'TC_API_key.json'),
+        'endpoint_config': endpoint_config,  # Add the full endpoint config
+        'url': endpoint_config.get('url'),  # Add the URL from endpoint config
+        'table': endpoint_config.get('table'),  # Add the table from endpoint config
+        'frequency': endpoint_config.get('frequency'),  # Add the frequency from endpoint config
+        'api_key': endpoint_config.get('api_key', 'default'),  # Add the API key name
+        'app_config': {  # Add app config settings
+            'log_level': config.app.log_level,
+            'enable_metrics': config.app.enable_metrics,
+            'metric_prefix': config.app.metric_prefix,
+            'google_cloud': {
+                'credentials_file': str(config.google.credentials_file)
+            }
+        }
+    }
+
+def run_endpoint(config: Config, registry: EndpointRegistry, endpoint_name: str) -> None:
+    """Create the processor for an endpoint and run it.
+    
+    Args:
+        config: Loaded application configuration
+        registry: Registry with loaded endpoint processors
+        endpoint_name: Name of the endpoint to process
+        
+    Raises:
+        Exception: Any error raised while processing the endpoint
+    """
+    logging.info(f"Processing endpoint: {endpoint_name}")
+    
+    # Get the processor directly from registry
+    processor_class = registry.get_processor(endpoint_name)
+    processor = processor_class(build_processor_config(config, endpoint_name))
+    
+    # Process the endpoint
+    logging.info(f"Starting {endpoint_name} processing...")
+    try:
+        processor.run()
+        logging.info(f"Successfully processed {endpoint_name}")
+    except Exception as e:
+        logging.error(f"Error processing {endpoint_name}: {str(e)}")
+        raise
+
 def main() -> None:
     """Main entry point for TCdatalogger.
     
@@ -23,7 +82,7 @@ def main() -> None:
     1. Parses command line arguments
     2. Loads and validates configuration
     3. Initializes the endpoint registry
-    4. Processes the specified endpoint
+    4. Processes the specified endpoints
     
     Command line arguments:
         --config-dir: Path to configuration directory containing:
@@ -31,8 +90,10 @@ def main() -> None:
             - TC_API_key.json: API key configuration
             - credentials.json: Google Cloud credentials
             - app_config.json: Application settings
-        --endpoint: Name of the endpoint to process (must match an endpoint
-                   name in TC_API_config.json)
+        --endpoint: Name of one or more endpoints to process (must match
+                   endpoint names in TC_API_config.json). Multiple endpoints
+                   are processed concurrently, since each run is dominated
+                   by API and BigQuery I/O.
     
     Exit codes:
         0: Success
@@ -41,8 +102,8 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="TCdatalogger - Torn City data collection")
     parser.add_argument("--config-dir", type=Path, default=Path("config"),
                        help="Path to configuration directory containing necessary config files")
-    parser.add_argument("--endpoint", type=str, required=True,
-                       help="Name of the endpoint to process (must match config)")
+    parser.add_argument("--endpoint", type=str, nargs='+', required=True,
+                       help="Name(s) of the endpoint(s) to process (must match config)")
     args = parser.parse_args()
 
     try:
@@ -53,50 +114,29 @@ def main() -> None:
         registry = EndpointRegistry()
         registry.load_processors()
         
-        # Run specific endpoint
-        endpoint_name = args.endpoint
-        if endpoint_name not in config.endpoints:
-            logging.error(f"Endpoint not found: {endpoint_name}")
-            sys.exit(1)
-            
-        endpoint_config = config.endpoints[endpoint_name]
-        logging.info(f"Processing endpoint: {endpoint_name}")
-        
-        # Get the processor directly from registry
-        processor_class = registry.get_processor(endpoint_name)
-        
-        # Create processor config
-        processor_config = {
-            'gcp_credentials_file': str(config.config_dir / 'credentials.json'),
-            'endpoint': endpoint_name,
-            'storage_mode': endpoint_config.get('storage_mode', 'append'),
-            'tc_api_key_file': str(config.config_dir / 'TC_API_key.json'),
-            'endpoint_config': endpoint_config,  # Add the full endpoint config
-            'url': endpoint_config.get('url'),  # Add the URL from endpoint config
-            'table': endpoint_config.get('table'),  # Add the table from endpoint config
-            'frequency': endpoint_config.get('frequency'),  # Add the frequency from endpoint config
-            'api_key': endpoint_config.get('api_key', 'default'),  # Add the API key name
-            'app_config': {  # Add app config settings
-                'log_level': config.app.log_level,
-                'enable_metrics': config.app.enable_metrics,
-                'metric_prefix': config.app.metric_prefix,
-                'google_cloud': {
-                    'credentials_file': str(config.google.credentials_file)
-                }
-            }
-        }
-        
-        # Create processor with config
-        processor = processor_class(processor_config)
+        endpoint_names = list(dict.fromkeys(args.endpoint))
+        for endpoint_name in endpoint_names:
+            if endpoint_name not in config.endpoints:
+                logging.error(f"Endpoint not found: {endpoint_name}")
+                sys.exit(1)
         
-        # Process the endpoint
-        logging.info(f"Starting {endpoint_name} processing...")
-        try:
-            processor.run()
-            logging.info(f"Successfully processed {endpoint_name}")
-        except Exception as e:
-            logging.error(f"Error processing {endpoint_name}: {str(e)}")
-            raise
+        if len(endpoint_names) == 1:
+            run_endpoint(config, registry, endpoint_names[0])
+        else:
+            failures = 0
+            with ThreadPoolExecutor(max_workers=min(16, len(endpoint_names))) as executor:
+                futures = [
+                    executor.submit(run_endpoint, config, registry, endpoint_name)
+                    for endpoint_name in endpoint_names
+                ]
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception:
+                        # Already logged by run_endpoint
+                        failures += 1
+            if failures:
+                raise RuntimeError(f"{failures} of {len(endpoint_names)} endpoints failed")
         
     except KeyboardInterrupt:
         logging.info("Shutting down...")
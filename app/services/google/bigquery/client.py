@@ -1,8 +1,11 @@
 """BigQuery client for data storage operations."""
 
-from typing import Dict, List, Union, Optional, Any
+from typing import Dict, List, Union, Optional, Any, Tuple
 from datetime import datetime
+from functools import lru_cache
+import time
 import pandas as pd
+from google.api_core import exceptions
 from google.cloud import bigquery
 from google.oauth2 import service_account
 import logging
@@ -11,6 +14,22 @@ class BigQueryError(Exception):
     """Base exception for BigQuery operations."""
     pass
 
+@lru_cache(maxsize=4)
+def _load_client(credentials_file: str) -> Tuple[service_account.Credentials, bigquery.Client]:
+    """Load credentials and build a BigQuery client for a credentials file.
+    
+    Results are cached so every BigQueryClient sharing a credentials file
+    reuses the same underlying client and its HTTP connections.
+    
+    Args:
+        credentials_file: Path to the service account credentials file.
+        
+    Returns:
+        Tuple of the loaded credentials and the client built from them
+    """
+    credentials = service_account.Credentials.from_service_account_file(credentials_file)
+    return credentials, bigquery.Client(credentials=credentials, project=credentials.project_id)
+
 class BigQueryClient:
     """Client for Google BigQuery operations.
     
@@ -27,7 +46,10 @@ class BigQueryClient:
         'BOOLEAN', 'BOOL', 'TIMESTAMP', 'DATE', 'TIME', 'DATETIME',
         'RECORD', 'STRUCT', 'NUMERIC', 'BIGNUMERIC', 'GEOGRAPHY'
     }
-
+    
+    # Seconds a fetched table's metadata is reused before asking BigQuery again
+    TABLE_CACHE_TTL = 300
+    
     def __init__(self, credentials_file: str):
         """Initialize the BigQuery client.
         
@@ -36,18 +58,20 @@ class BigQueryClient:
         """
         try:
             self.credentials_path = credentials_file
-            self.credentials = service_account.Credentials.from_service_account_file(credentials_file)
+            self.credentials, self.client = _load_client(credentials_file)
             self.project_id = self.credentials.project_id
-            self.client = bigquery.Client(credentials=self.credentials, project=self.project_id)
+            # Table metadata keyed by full table ID: (fetch time, Table)
+            self._table_cache: Dict[str, Tuple[float, bigquery.Table]] = {}
         except Exception as e:
             raise BigQueryError(f"Failed to initialize BigQuery client: {str(e)}")
 
     def _initialize_client(self) -> None:
         """Initialize or reinitialize the BigQuery client."""
         try:
-            self.credentials = service_account.Credentials.from_service_account_file(self.credentials_path)
+            # Drop the shared client so every user picks up the fresh one
+            _load_client.cache_clear()
+            self.credentials, self.client = _load_client(self.credentials_path)
             self.project_id = self.credentials.project_id
-            self.client = bigquery.Client(credentials=self.credentials, project=self.project_id)
         except Exception as e:
             raise BigQueryError(f"Failed to reinitialize BigQuery client: {str(e)}")
 
@@ -98,7 +122,31 @@ class BigQueryClient:
             Table: BigQuery table reference
         """
         full_table_id = self._get_full_table_id(table_id)
-        return self.client.get_table(full_table_id)
+        return self._fetch_table(full_table_id)
+    
+    def _fetch_table(self, full_table_id: str) -> bigquery.Table:
+        """Fetch table metadata, reusing a recent result when available.
+        
+        Args:
+            full_table_id: Fully qualified table ID
+            
+        Returns:
+            Table: BigQuery table metadata
+        """
+        cached = self._table_cache.get(full_table_id)
+        if cached is not None and time.monotonic() - cached[0] < self.TABLE_CACHE_TTL:
+            return cached[1]
+        table = self.client.get_table(full_table_id)
+        self._table_cache[full_table_id] = (time.monotonic(), table)
+        return table
+    
+    def _invalidate_table(self, full_table_id: str) -> None:
+        """Drop cached metadata for a table after it has been changed.
+        
+        Args:
+            full_table_id: Fully qualified table ID
+        """
+        self._table_cache.pop(full_table_id, None)
         
     def create_table(self, table_id: str, schema: List[Dict[str, str]]) -> None:
         """Create a new BigQuery table.
@@ -114,6 +162,7 @@ class BigQueryClient:
         schema_fields = self._convert_schema(schema)
         table = bigquery.Table(full_table_id, schema=schema_fields)
         self.client.create_table(table)
+        self._invalidate_table(full_table_id)
 
     def _convert_schema(self, schema: List[Dict[str, str]]) -> List[bigquery.SchemaField]:
         """Convert schema dict to BigQuery SchemaField objects.
@@ -160,19 +209,40 @@ class BigQueryClient:
             )
         return schema_fields
 
-    def upload_dataframe(self, df: pd.DataFrame, table_id: str, write_disposition: str = 'WRITE_APPEND') -> None:
+    def upload_dataframe(self, df: pd.DataFrame, table_id: str, write_disposition: str = 'WRITE_APPEND',
+                         schema: Optional[List[bigquery.SchemaField]] = None) -> None:
         """Upload a pandas DataFrame to BigQuery.
         
         Args:
             df: The DataFrame to upload
             table_id: The table to write to (format: project.dataset.table)
             write_disposition: Write disposition (WRITE_APPEND, WRITE_TRUNCATE, WRITE_EMPTY)
+            schema: Optional table schema. When given, the Parquet serialization
+                uses these types directly instead of inferring them from the data.
         """
         try:
-            job_config = bigquery.LoadJobConfig(write_disposition=write_disposition)
+            # Load jobs create a missing table themselves, so callers need no
+            # separate existence check or create_table round trip
+            job_config = bigquery.LoadJobConfig(
+                write_disposition=write_disposition,
+                create_disposition='CREATE_IF_NEEDED'
+            )
+            if schema:
+                job_config.schema = [field for field in schema if field.name in df.columns]
+                # Arrow-backed strings serialize to Parquet as a buffer copy
+                # instead of converting each Python object
+                string_columns = {
+                    field.name: 'string[pyarrow]' for field in job_config.schema
+                    if field.field_type == 'STRING' and df[field.name].dtype == object
+                }
+                if string_columns:
+                    df = df.astype(string_columns)
             # Use table_id directly since it should be fully qualified
             job = self.client.load_table_from_dataframe(df, table_id, job_config=job_config)
             job.result()  # Wait for the job to complete
+            if write_disposition == 'WRITE_TRUNCATE':
+                # Truncating loads replace the table schema
+                self._invalidate_table(table_id)
         except Exception as e:
             raise BigQueryError(f"Failed to upload data to {table_id}: {str(e)}")
 
@@ -214,7 +284,7 @@ class BigQueryClient:
         """
         try:
             full_table_id = self._get_full_table_id(table_id)
-            self.client.get_table(full_table_id)
+            self._fetch_table(full_table_id)
             return True
         except exceptions.NotFound:
             return False
@@ -232,16 +302,19 @@ class BigQueryClient:
             List[SchemaField]: Table schema
         """
         full_table_id = self._get_full_table_id(table_id)
-        table = self.client.get_table(full_table_id)
+        table = self._fetch_table(full_table_id)
         return table.schema
 
-    def write_data(self, data: Union[List[Dict], pd.DataFrame], table_id: str, write_disposition: str = 'WRITE_APPEND') -> None:
+    def write_data(self, data: Union[List[Dict], pd.DataFrame], table_id: str, write_disposition: str = 'WRITE_APPEND',
+                   schema: Optional[List[bigquery.SchemaField]] = None) -> None:
         """Write data to a BigQuery table.
         
         Args:
             data: List of dictionaries or pandas DataFrame containing the data
             table_id: The table to write to (format: project.dataset.table)
             write_disposition: Write disposition (WRITE_APPEND, WRITE_TRUNCATE, WRITE_EMPTY)
+            schema: Optional schema for the data. Loads that keep an existing
+                table use that table's own schema instead.
         """
         try:
             # Convert to DataFrame if necessary
@@ -249,8 +322,12 @@ class BigQueryClient:
             if df.empty:
                 logging.warning("No data to write - empty DataFrame")
                 return
+            if schema and write_disposition != 'WRITE_TRUNCATE' and self.table_exists(table_id):
+                # A declared REQUIRED mode is rejected when appending to a
+                # table whose field is NULLABLE, so follow the table
+                schema = self.get_schema(table_id)
             # Use table_id directly since it should be fully qualified
-            self.upload_dataframe(df, table_id, write_disposition=write_disposition)
+            self.upload_dataframe(df, table_id, write_disposition=write_disposition, schema=schema)
         except Exception as e:
             raise BigQueryError(f"Failed to write data to {table_id}: {str(e)}")
 
@@ -283,11 +360,13 @@ class BigQueryClient:
         Raises:
             BigQueryError: If the write operation fails after all retries
         """
+        # Build the frame once; only the upload is retried
+        df = pd.DataFrame(data)
+        full_table_id = self._get_full_table_id(table_id)
         attempt = 0
         while attempt < max_retries:
             try:
-                df = pd.DataFrame(data)
-                self.upload_dataframe(df, self._get_full_table_id(table_id))
+                self.upload_dataframe(df, full_table_id)
                 return
             except Exception as e:
                 attempt += 1
@@ -332,6 +411,13 @@ class BigQueryClient:
             existing_fields = {field.name: field for field in existing_schema}
             new_fields = {field.name: field for field in new_schema_fields}
             
+            # Unchanged schemas are the common case and need no further checks
+            if existing_fields.keys() == new_fields.keys() and all(
+                (field.field_type, field.mode) == (new_fields[name].field_type, new_fields[name].mode)
+                for name, field in existing_fields.items()
+            ):
+                return
+            
             # Check for missing required fields
             for name, field in existing_fields.items():
                 if field.mode == 'REQUIRED' and name not in new_fields:
@@ -352,7 +438,7 @@ class BigQueryClient:
                 else:
                     # New field being added
                     if new_field.mode == 'REQUIRED':
-                        table = self.client.get_table(self._get_full_table_id(table_id))
+                        table = self._fetch_table(self._get_full_table_id(table_id))
                         if table.num_rows > 0:
                             raise ValueError(f"Schema mismatch: Cannot add required field '{name}' to table with existing data")
         except Exception as e:
@@ -451,10 +537,12 @@ class BigQueryClient:
                 if field.mode == 'REPEATED':
                     if value is not None and not isinstance(value, (list, tuple)):
                         raise ValueError(f"Record {i}: Repeated field '{name}' must be a list or tuple")
-                    if value:
-                        for j, item in enumerate(value):
-                            if item is None:
-                                raise ValueError(f"Record {i}: Repeated field '{name}' item {j} cannot be null")
+                    # Identity check: 'None in value' compares with ==, which
+                    # misbehaves for items such as pd.NA or numpy arrays
+                    if isinstance(value, (list, tuple)):
+                        j = next((j for j, item in enumerate(value) if item is None), None)
+                        if j is not None:
+                            raise ValueError(f"Record {i}: Repeated field '{name}' item {j} cannot be null")
                             
                 # Check NULLABLE fields
                 if field.mode == 'NULLABLE':
@@ -587,6 +675,7 @@ class BigQueryClient:
         table = self.client.get_table(full_table_id)
         table.schema = schema
         self.client.update_table(table, ['schema'])
+        self._invalidate_table(full_table_id)
 
     def get_table_schema(self, table_id: str) -> List[bigquery.SchemaField]:
         """Get the schema of a table.
@@ -602,7 +691,7 @@ class BigQueryClient:
         """
         try:
             full_table_id = self._get_full_table_id(table_id)
-            table = self.client.get_table(full_table_id)
+            table = self._fetch_table(full_table_id)
             return table.schema
         except exceptions.NotFound:
             raise ValueError(f"Table {table_id} does not exist")
@@ -629,33 +718,6 @@ class BigQueryClient:
             
         self.write_data_with_retry(data, table_id)
 
-    def _infer_schema_from_data(self, sample_data: Dict[str, Any]) -> List[Dict[str, str]]:
-        """Infer BigQuery schema from sample data.
-        
-        Args:
-            sample_data: Sample data dictionary
-            
-        Returns:
-            List[Dict[str, str]]: Inferred schema
-        """
-        schema = []
-        for field_name, value in sample_data.items():
-            field_type = 'STRING'
-            if isinstance(value, bool):
-                field_type = 'BOOLEAN'
-            elif isinstance(value, int):
-                field_type = 'INTEGER'
-            elif isinstance(value, float):
-                field_type = 'FLOAT'
-            
-            schema.append({
-                'name': field_name,
-                'type': field_type,
-                'mode': 'NULLABLE'
-            })
-        
-        return schema
-
     def delete_table(self, table_id: str) -> None:
         """Delete a BigQuery table.
         
@@ -668,6 +730,7 @@ class BigQueryClient:
         try:
             full_table_id = self._get_full_table_id(table_id)
             self.client.delete_table(full_table_id)
+            self._invalidate_table(full_table_id)
         except Exception as e:
             raise ValueError(f"Failed to delete table {table_id}: {str(e)}")
 
@@ -700,14 +763,14 @@ class BigQueryClient:
             # Get the full table ID
             full_table_id = self._get_full_table_id(table_id)
 
-            # Get or infer schema
-            if not self.table_exists(table_id):
-                if not data:
+            if not data:
+                # Only empty input needs the existence check: without rows
+                # there is no load job to create a missing table
+                if not self.table_exists(table_id):
                     raise BigQueryError("Cannot create table without data or schema")
-                schema = self._infer_schema_from_data(data[0])
-                self.create_table(table_id, schema)
+                return
 
-            # Process data in batches
+            # Process data in batches; the first load creates the table if needed
             for i in range(0, len(data), batch_size):
                 batch = data[i:i + batch_size]
                 df = pd.DataFrame(batch)
@@ -2,7 +2,7 @@
 
 This module provides base classes for processing data from Torn City API endpoints:
 - BaseEndpointProcessor: Abstract base class for all endpoint processors
-- EndpointRegistry: Registry for managing endpoint processors
+- SchemaValidator: Schema validation for BigQuery data
 """
 
 import logging
@@ -18,6 +18,7 @@ import re
 from google.cloud import bigquery
 from google.cloud import monitoring_v3
 
+from app.core.common import load_api_keys_file
 from app.services.common.types import SchemaType, DataType, ConfigType, validate_schema
 from app.services.torncity.client import TornClient
 from app.services.torncity.exceptions import (
@@ -33,6 +34,10 @@ from app.services.google.bigquery.client import BigQueryClient
 class BaseEndpointProcessor(ABC):
     """Base class for Torn City API endpoint processors."""
 
+    # Timestamp layouts tried against a column's first value before falling
+    # back to pandas' per-element mixed-format parser
+    DATETIME_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%S%z')
+
     def __init__(self, config: Dict[str, Any]) -> None:
         """Initialize the BaseEndpointProcessor.
 
@@ -86,6 +91,9 @@ class BaseEndpointProcessor(ABC):
         
         self.schema_validator = None
         
+        # API key resolved from tc_api_key_file on the first run
+        self._api_key = None
+        
     @property
     def bq_client(self) -> BigQueryClient:
         """Get or create the BigQuery client.
@@ -146,9 +154,10 @@ class BaseEndpointProcessor(ABC):
             data = response.json()
             
             # Log the API response structure
-            logging.info(f"API response structure: {json.dumps({k: type(v).__name__ for k, v in data.items()})}")
-            if 'data' in data:
-                logging.info(f"Data field structure: {json.dumps({k: type(v).__name__ for k, v in data['data'].items()})}")
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(f"API response structure: {json.dumps({k: type(v).__name__ for k, v in data.items()})}")
+                if 'data' in data:
+                    logging.debug(f"Data field structure: {json.dumps({k: type(v).__name__ for k, v in data['data'].items()})}")
 
             if not all_data:
                 all_data = data
@@ -204,7 +213,7 @@ class BaseEndpointProcessor(ABC):
             if not any(table.startswith(prefix) for prefix in ['torncity-', 'torn_data.']):
                 raise ValueError(f"Table ID '{table}' must be fully qualified (project.dataset.table)")
                 
-            self.bq_client.write_data(data, table, write_disposition=write_disposition)
+            self.bq_client.write_data(data, table, write_disposition=write_disposition, schema=self.get_schema())
         except Exception as e:
             self.logger.error(f"Failed to write data to BigQuery: {str(e)}")
             raise
@@ -212,21 +221,7 @@ class BaseEndpointProcessor(ABC):
     def run(self) -> None:
         """Run the processor to fetch and process data."""
         try:
-            # Get the API key from the config
-            api_key_name = self.config.get('api_key', 'default')
-
-            # Load API keys from file using the correct path
-            api_key_file = self.config.get('tc_api_key_file')
-            try:
-                with open(api_key_file) as f:
-                    api_keys = json.load(f)
-            except Exception as e:
-                raise ValueError(f"Failed to load API keys from {api_key_file}: {str(e)}")
-
-            # Get the actual API key
-            api_key = api_keys.get(api_key_name)
-            if not api_key:
-                raise ValueError(f"API key '{api_key_name}' not found in API key file")
+            api_key = self._resolve_api_key()
 
             # Check if the endpoint uses time window-based fetching
             if self.endpoint_config.get('use_time_windows', False):
@@ -258,8 +253,9 @@ class BaseEndpointProcessor(ABC):
                 raise ValueError("No data to write - empty DataFrame")
             
             # Log the processed data for debugging
-            logging.debug(f"Processed data shape: {processed_data.shape}")
-            logging.debug(f"Processed data columns: {processed_data.columns.tolist()}")
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(f"Processed data shape: {processed_data.shape}")
+                logging.debug(f"Processed data columns: {processed_data.columns.tolist()}")
             
             # Write the data to BigQuery
             self.write_to_bigquery(processed_data)
@@ -268,6 +264,36 @@ class BaseEndpointProcessor(ABC):
             logging.error(f"Error running processor: {str(e)}")
             raise
 
+    def _resolve_api_key(self) -> str:
+        """Get the API key for this processor, loading it on first use.
+
+        Returns:
+            str: The API key named by the config
+
+        Raises:
+            ValueError: If the key file cannot be read or the key is missing
+        """
+        if self._api_key is not None:
+            return self._api_key
+
+        # Get the API key from the config
+        api_key_name = self.config.get('api_key', 'default')
+
+        # Load API keys from file using the correct path
+        api_key_file = self.config.get('tc_api_key_file')
+        try:
+            api_keys = load_api_keys_file(api_key_file)
+        except Exception as e:
+            raise ValueError(f"Failed to load API keys from {api_key_file}: {str(e)}")
+
+        # Get the actual API key
+        api_key = api_keys.get(api_key_name)
+        if not api_key:
+            raise ValueError(f"API key '{api_key_name}' not found in API key file")
+
+        self._api_key = api_key
+        return api_key
+
     def _get_current_timestamp(self) -> str:
         """Get the current timestamp in ISO format.
         
@@ -406,8 +432,9 @@ class BaseEndpointProcessor(ABC):
 
             # Log validation results
             logging.info(f"Validated {len(transformed_data)} rows")
-            logging.debug(f"DataFrame shape: {transformed_data.shape}")
-            logging.debug(f"DataFrame columns: {transformed_data.columns.tolist()}")
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(f"DataFrame shape: {transformed_data.shape}")
+                logging.debug(f"DataFrame columns: {transformed_data.columns.tolist()}")
 
             return transformed_data
 
@@ -522,6 +549,34 @@ class BaseEndpointProcessor(ABC):
         
         return df
 
+    @classmethod
+    def _sniff_datetime_format(cls, series: pd.Series) -> Optional[str]:
+        """Detect the timestamp layout of a column from its first value.
+        
+        Args:
+            series: Column of raw timestamp values
+            
+        Returns:
+            Optional[str]: 'unix' for epoch seconds, a strptime format for
+                string timestamps, or None if no known layout matches
+        """
+        first_index = series.first_valid_index()
+        if first_index is None:
+            return None
+        sample = series[first_index]
+        if isinstance(sample, (int, float, np.integer, np.floating)) and not isinstance(sample, bool):
+            return 'unix'
+        sample = str(sample)
+        if sample.isdigit():
+            return 'unix'
+        for fmt in cls.DATETIME_FORMATS:
+            try:
+                datetime.strptime(sample, fmt)
+                return fmt
+            except ValueError:
+                continue
+        return None
+
     def _validate_column_type(self, series: pd.Series, field: bigquery.SchemaField) -> pd.Series:
         """Validate a column's data type.
         
@@ -561,8 +616,17 @@ class BaseEndpointProcessor(ABC):
                 if pd.api.types.is_datetime64_any_dtype(series):
                     return series
                 
-                # Convert various timestamp formats
-                converted = pd.to_datetime(series, format='mixed', errors='coerce')
+                # Parse with the layout of the first value so pandas can use its
+                # fixed-format parser, retrying any misses as mixed formats
+                fmt = self._sniff_datetime_format(series)
+                if fmt == 'unix':
+                    converted = pd.to_datetime(pd.to_numeric(series, errors='coerce'), unit='s', errors='coerce')
+                else:
+                    converted = pd.to_datetime(series, format=fmt or 'mixed', errors='coerce')
+                    if fmt:
+                        missed = converted.isna() & series.notna()
+                        if missed.any():
+                            converted[missed] = pd.to_datetime(series[missed], format='mixed', errors='coerce')
                 
                 # Only fill NaT with current time if field is required
                 if field.mode == 'REQUIRED':
@@ -595,7 +659,8 @@ class BaseEndpointProcessor(ABC):
             self.bq_client.upload_dataframe(
                 df=df,
                 table_id=table_id,
-                write_disposition=self.endpoint_config['storage_mode']
+                write_disposition=self.endpoint_config['storage_mode'],
+                schema=schema
             )
             
             # Record upload metrics
@@ -712,9 +777,12 @@ class BaseEndpointProcessor(ABC):
             if field.name not in data.columns:
                 continue
                 
-            values = data[field.name].dropna()
-            if len(values) == 0:
+            values = data[field.name]
+            if values.first_valid_index() is None:
                 continue
+            # Object columns mix NULLs with their values, so only the present
+            # values show whether the column already has the right type
+            values = values.dropna()
                 
             if field.field_type == "INTEGER":
                 if not pd.api.types.is_numeric_dtype(values):
@@ -735,6 +803,14 @@ class BaseEndpointProcessor(ABC):
 class SchemaValidator:
     """Handles schema validation for BigQuery data."""
     
+    # numpy dtype kinds that already satisfy each BigQuery field type
+    DTYPE_KINDS = {
+        'INTEGER': 'iu',
+        'FLOAT': 'f',
+        'BOOLEAN': 'b',
+        'TIMESTAMP': 'M'
+    }
+    
     def __init__(self, schema: List[bigquery.SchemaField]):
         """Initialize the schema validator.
         
@@ -866,10 +942,78 @@ class SchemaValidator:
         # Validate each column
         for col in df.columns:
             if col in self.schema:
-                df[col] = df[col].apply(lambda x: self.validate_field(col, x))
+                # Columns whose dtype already matches the field type need no
+                # per-cell conversion; only nulls in REQUIRED fields can fail
+                if self._dtype_matches(df[col], self.schema[col].field_type):
+                    if self.schema[col].mode == 'REQUIRED' and df[col].isna().any():
+                        raise DataValidationError(f"Required field {col} cannot be NULL")
+                    continue
+                df[col] = self._convert_column(col, df[col])
         
         return df
     
+    def _convert_column(self, name: str, series: pd.Series) -> pd.Series:
+        """Convert a column to its field type, vectorized where possible.
+        
+        STRING and FLOAT columns are converted in a single pandas call; other
+        types fall back to validate_field for each value.
+        
+        Args:
+            name: Field name
+            series: Column to convert
+            
+        Returns:
+            Converted column
+            
+        Raises:
+            DataValidationError: If a value cannot be converted
+        """
+        field = self.schema[name]
+        if field.field_type not in ('STRING', 'FLOAT'):
+            return series.apply(lambda x: self.validate_field(name, x))
+        
+        nulls = series.isna()
+        if field.mode == 'REQUIRED' and nulls.any():
+            raise DataValidationError(f"Required field {name} cannot be NULL")
+        
+        if field.field_type == 'STRING':
+            return series.astype(str).where(~nulls)
+        
+        converted = pd.to_numeric(series, errors='coerce').astype('float64')
+        invalid = converted.isna() & ~nulls
+        if invalid.any():
+            # float() accepts spellings to_numeric rejects, such as 'nan' or
+            # '1_000', so retry just those values the way validate_field would
+            positions = np.flatnonzero(invalid.to_numpy())
+            retried = []
+            for value in series.iloc[positions]:
+                try:
+                    retried.append(float(value))
+                except (ValueError, TypeError):
+                    raise DataValidationError(
+                        f"Invalid value for field {name} ({field.field_type}): could not convert {value!r} to float"
+                    )
+            converted.iloc[positions] = retried
+        return converted
+    
+    @staticmethod
+    def _dtype_matches(series: pd.Series, field_type: str) -> bool:
+        """Check whether a column's dtype already satisfies a BigQuery type.
+        
+        Args:
+            series: Column to check
+            field_type: BigQuery field type
+            
+        Returns:
+            True if the column can be used without per-cell conversion
+        """
+        kinds = SchemaValidator.DTYPE_KINDS.get(field_type)
+        if kinds is not None:
+            return series.dtype.kind in kinds
+        elif field_type == 'STRING':
+            return isinstance(series.dtype, pd.StringDtype)
+        return False
+    
     def get_quality_metrics(self, df: pd.DataFrame) -> Dict[str, float]:
         """Calculate data quality metrics.
         
@@ -879,28 +1023,30 @@ class SchemaValidator:
         Returns:
             Dictionary of quality metrics
         """
+        # One null scan serves both the frame-wide and per-field metrics
+        null_counts = df.isnull().sum()
         metrics = {
             'total_rows': len(df),
-            'null_percentage': df.isnull().mean().mean() * 100,
+            'null_percentage': (null_counts / len(df)).mean() * 100,
             'duplicate_rows': df.duplicated().sum(),
         }
         
         # Field-specific metrics
         for name, field in self.schema.items():
             if name in df.columns:
-                metrics[f'{name}_null_count'] = df[name].isnull().sum()
+                metrics[f'{name}_null_count'] = null_counts[name]
+                has_values = null_counts[name] < len(df)
                 
+                # min/max/mean/nunique skip nulls, so no dropna() copy is needed
                 if field.field_type in ('INTEGER', 'FLOAT'):
-                    non_null = df[name].dropna()
-                    if not non_null.empty:
-                        metrics[f'{name}_min'] = float(non_null.min())
-                        metrics[f'{name}_max'] = float(non_null.max())
-                        metrics[f'{name}_mean'] = float(non_null.mean())
+                    if has_values:
+                        metrics[f'{name}_min'] = float(df[name].min())
+                        metrics[f'{name}_max'] = float(df[name].max())
+                        metrics[f'{name}_mean'] = float(df[name].mean())
                 
                 elif field.field_type == 'STRING':
-                    non_null = df[name].dropna()
-                    if not non_null.empty:
-                        metrics[f'{name}_empty_count'] = (non_null == '').sum()
-                        metrics[f'{name}_unique_count'] = non_null.nunique()
+                    if has_values:
+                        metrics[f'{name}_empty_count'] = (df[name] == '').sum()
+                        metrics[f'{name}_unique_count'] = df[name].nunique()
         
         return metrics 
\ No newline at end of file
@@ -32,6 +32,7 @@ from tenacity import (
     after_log
 )
 
+from app.core.common import load_api_keys_file
 from .exceptions import (
     TornAPIError,
     TornAPIKeyError,
@@ -40,6 +41,12 @@ from .exceptions import (
     TornAPITimeoutError
 )
 
+# Matches strings shaped like a Torn API key (16 alphanumeric characters)
+_API_KEY_PATTERN_RE = re.compile(r'[a-zA-Z0-9]{16}')
+
+# Matches the API key query parameter in request URLs
+_KEY_MASK_RE = re.compile(r'key=[^&]+')
+
 
 class TornClient:
     """Client for interacting with the Torn API."""
@@ -58,6 +65,11 @@ class TornClient:
     MAX_RETRIES = 3
     BACKOFF_FACTOR = 0.5
     RETRY_STATUS_FORCELIST = [408, 429, 500, 502, 503, 504]
+    
+    # Keep-alive connection pool settings; the pool must be at least as large
+    # as the number of concurrent requests or connections are discarded
+    POOL_CONNECTIONS = 8
+    POOL_MAXSIZE = 16
 
     def __init__(self, api_key_or_file: str):
         """Initialize the Torn API client.
@@ -86,7 +98,11 @@ class TornClient:
         )
         
         # Configure adapter with retry strategy
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=retry_strategy
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -110,8 +126,7 @@ class TornClient:
                 if not os.path.exists(self.api_key_or_file):
                     raise TornAPIKeyError("API keys file not found")
                 try:
-                    with open(self.api_key_or_file, 'r') as f:
-                        self.api_keys = json.load(f)
+                    self.api_keys = load_api_keys_file(self.api_key_or_file)
                 except json.JSONDecodeError:
                     raise TornAPIKeyError("API keys file must contain valid JSON")
                 if not isinstance(self.api_keys, dict):
@@ -167,7 +182,7 @@ class TornClient:
             str: URL with sensitive information masked
         """
         # Mask API keys in URLs
-        masked = re.sub(r'key=[^&]+', 'key=***', url)
+        masked = _KEY_MASK_RE.sub('key=***', url)
         # Mask any other potential sensitive data
         for key in self.api_keys.values():
             masked = masked.replace(key, '***')
@@ -248,7 +263,7 @@ class TornClient:
             masked_message = masked_message.replace(key_name, "***")
         
         # Mask any potential API key patterns (16 alphanumeric characters)
-        masked_message = re.sub(r'[a-zA-Z0-9]{16}', '***', masked_message)
+        masked_message = _API_KEY_PATTERN_RE.sub('***', masked_message)
         
         return masked_message
 
@@ -72,7 +72,8 @@ class BasicFactionEndpointProcessor(BaseEndpointProcessor):
         Raises:
             DataValidationError: If the data is invalid or missing required fields.
         """
-        logging.info(f"API response structure: {json.dumps({k: type(v).__name__ for k, v in data.items()})}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"API response structure: {json.dumps({k: type(v).__name__ for k, v in data.items()})}")
         
         # Extract basic data from response
         basic_data = data.get('basic')
@@ -80,7 +81,8 @@ class BasicFactionEndpointProcessor(BaseEndpointProcessor):
             raise DataValidationError("No basic faction data found in API response")
             
         # Log raw data for debugging
-        logging.info(f"Raw basic data: {json.dumps(basic_data, indent=2)}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"Raw basic data: {json.dumps(basic_data, separators=(',', ':'))}")
             
         # Create a record with all required fields
         record = {
@@ -105,7 +107,8 @@ class BasicFactionEndpointProcessor(BaseEndpointProcessor):
         }
         
         # Log transformed record for debugging
-        logging.info(f"Transformed record: {json.dumps(record, default=str, indent=2)}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"Transformed record: {json.dumps(record, default=str, separators=(',', ':'))}")
         
         # Convert to DataFrame
         df = pd.DataFrame([record])
@@ -4,12 +4,18 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List, Any
 import json
+from itertools import islice
 
 import pandas as pd
 import numpy as np
 import time
 from google.cloud import bigquery
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from app.services.torncity.base import BaseEndpointProcessor, DataValidationError
 
 class CrimesEndpointProcessor(BaseEndpointProcessor):
@@ -101,11 +107,14 @@ class CrimesEndpointProcessor(BaseEndpointProcessor):
         # Log detailed information about the crimes data
         logging.info(f"Processing crimes data:")
         logging.info(f"Total crimes in response: {len(crimes_data)}")
-        logging.info(f"Sample crime IDs: {[c.get('id') for c in list(crimes_data)[:5]]}")
-        logging.info(f"Response data structure: {json.dumps({k: type(v).__name__ for k, v in data.items()}, indent=2)}")
+        logging.info(f"Sample crime IDs: {[c.get('id') for c in islice(crimes_data, 5)]}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"Response data structure: {json.dumps({k: type(v).__name__ for k, v in data.items()})}")
         
         transformed_data = []
-        server_timestamp = pd.Timestamp.now()
+        base_crimes = []
+        # Naive UTC, matching the epoch columns converted below
+        server_timestamp = pd.Timestamp.now(tz='UTC').tz_localize(None)
         
         for crime in crimes_data:
             try:
@@ -129,40 +138,32 @@ class CrimesEndpointProcessor(BaseEndpointProcessor):
                     if isinstance(rewards.get('payout'), dict):
                         payout = rewards['payout']
 
-                # Convert timestamps with error handling
-                def safe_timestamp(ts):
-                    if not ts:
-                        return None
-                    try:
-                        return pd.Timestamp.fromtimestamp(ts)
-                    except (ValueError, TypeError, OSError) as e:
-                        logging.warning(f"Failed to convert timestamp {ts}: {str(e)}")
-                        return None
-
                 # Create base crime dictionary with common fields
                 base_crime = {
-                    'server_timestamp': server_timestamp,
                     'id': int(crime.get('id', 0)),
                     'name': str(crime.get('name', 'Unknown')),
                     'difficulty': int(crime.get('difficulty', 0)),
                     'status': str(crime.get('status', 'Unknown')),
-                    'created_at': safe_timestamp(crime.get('created_at')) or server_timestamp,
-                    'planning_at': safe_timestamp(crime.get('planning_at')),
-                    'executed_at': safe_timestamp(crime.get('executed_at')),
-                    'ready_at': safe_timestamp(crime.get('ready_at')),
-                    'expired_at': safe_timestamp(crime.get('expired_at')),
+                    'created_at': crime.get('created_at'),
+                    'planning_at': crime.get('planning_at'),
+                    'executed_at': crime.get('executed_at'),
+                    'ready_at': crime.get('ready_at'),
+                    'expired_at': crime.get('expired_at'),
                     'rewards_money': int(rewards.get('money')) if rewards.get('money') is not None else None,
                     'rewards_respect': int(rewards.get('respect')) if rewards.get('respect') is not None else None,
                     'rewards_payout_type': str(payout.get('type', '')),
                     'rewards_payout_percentage': int(payout.get('percentage')) if payout.get('percentage') is not None else None,
                     'rewards_payout_paid_by': int(payout.get('paid_by')) if payout.get('paid_by') is not None else None,
-                    'rewards_payout_paid_at': safe_timestamp(payout.get('paid_at'))
+                    'rewards_payout_paid_at': payout.get('paid_at')
                 }
+                # Slot rows reference the crime by position and are joined once at the end
+                crime_idx = len(base_crimes)
+                base_crimes.append(base_crime)
 
                 # If no slots, create one row with base crime data
                 if not slots:
                     transformed_data.append({
-                        **base_crime,
+                        '_crime_idx': crime_idx,
                         'slots_position': '',
                         'slots_item_requirement_id': None,
                         'slots_item_requirement_is_reusable': None,
@@ -177,7 +178,18 @@ class CrimesEndpointProcessor(BaseEndpointProcessor):
                     })
                     continue
 
-                # Create a row for each slot
+                # Reward item fields are the same for every slot, so build them once
+                items_to_process = items if items else [{}]
+                item_fields = [
+                    {
+                        'rewards_items_id': int(item.get('id')) if item.get('id') is not None else None,
+                        'rewards_items_quantity': int(item.get('quantity')) if item.get('quantity') is not None else None
+                    }
+                    for item in items_to_process
+                    if isinstance(item, dict)
+                ]
+
+                # Create a row for each slot and reward item
                 for slot in slots:
                     if not isinstance(slot, dict):
                         continue
@@ -185,27 +197,19 @@ class CrimesEndpointProcessor(BaseEndpointProcessor):
                     item_req = slot.get('item_requirement', {}) if isinstance(slot.get('item_requirement'), dict) else {}
                     user = slot.get('user', {}) if isinstance(slot.get('user'), dict) else {}
 
-                    # Create a row for each item in rewards (or one row with no item if no rewards)
-                    items_to_process = items if items else [{}]
-                    for item in items_to_process:
-                        if not isinstance(item, dict):
-                            continue
-
-                        transformed_crime = {
-                            **base_crime,
-                            'slots_position': str(slot.get('position', '')),
-                            'slots_item_requirement_id': int(item_req.get('id')) if item_req.get('id') is not None else None,
-                            'slots_item_requirement_is_reusable': bool(item_req.get('is_reusable', False)),
-                            'slots_item_requirement_is_available': bool(item_req.get('is_available', False)),
-                            'slots_user_id': int(user.get('id')) if user.get('id') is not None else None,
-                            'slots_user_joined_at': safe_timestamp(user.get('joined_at')),
-                            'slots_user_progress': float(user.get('progress', 0)),
-                            'slots_success_chance': int(slot.get('success_chance', 0)),
-                            'slots_crime_pass_rate': int(slot.get('checkpoint_pass_rate', 0)),
-                            'rewards_items_id': int(item.get('id')) if item.get('id') is not None else None,
-                            'rewards_items_quantity': int(item.get('quantity')) if item.get('quantity') is not None else None
-                        }
-                        transformed_data.append(transformed_crime)
+                    slot_fields = {
+                        '_crime_idx': crime_idx,
+                        'slots_position': str(slot.get('position', '')),
+                        'slots_item_requirement_id': int(item_req.get('id')) if item_req.get('id') is not None else None,
+                        'slots_item_requirement_is_reusable': bool(item_req.get('is_reusable', False)),
+                        'slots_item_requirement_is_available': bool(item_req.get('is_available', False)),
+                        'slots_user_id': int(user.get('id')) if user.get('id') is not None else None,
+                        'slots_user_joined_at': user.get('joined_at'),
+                        'slots_user_progress': float(user.get('progress', 0)),
+                        'slots_success_chance': int(slot.get('success_chance', 0)),
+                        'slots_crime_pass_rate': int(slot.get('checkpoint_pass_rate', 0))
+                    }
+                    transformed_data.extend({**slot_fields, **fields} for fields in item_fields)
 
             except Exception as e:
                 crime_id = crime.get('id', 'unknown') if isinstance(crime, dict) else 'unknown'
@@ -216,50 +220,77 @@ class CrimesEndpointProcessor(BaseEndpointProcessor):
             logging.warning("No valid crimes data after transformation")
             return pd.DataFrame(columns=[field.name for field in self.get_schema()])
 
-        df = pd.DataFrame(transformed_data)
+        slots_df = pd.DataFrame(transformed_data)
+        crimes_df = pd.DataFrame(base_crimes).take(slots_df.pop('_crime_idx').to_numpy())
+        df = pd.concat([crimes_df.reset_index(drop=True), slots_df], axis=1)
+        # Broadcast the fetch time as a scalar rather than copying it into every row
+        df.insert(0, 'server_timestamp', server_timestamp)
         
-        # Convert types to match schema
+        # Convert types to match schema, collecting the columns so the frame
+        # is rebuilt once instead of on every assignment
+        coerced: Dict[str, Any] = {}
         for field in self.get_schema():
             if field.field_type == 'TIMESTAMP':
                 if field.name not in df.columns:
-                    df[field.name] = pd.NaT
+                    coerced[field.name] = pd.NaT
                 else:
-                    df[field.name] = pd.to_datetime(df[field.name], errors='coerce')
+                    coerced[field.name] = self._convert_timestamp_column(df[field.name])
             elif field.field_type == 'INTEGER':
                 if field.name not in df.columns:
-                    df[field.name] = pd.NA if field.mode == 'NULLABLE' else 0
+                    coerced[field.name] = pd.NA if field.mode == 'NULLABLE' else 0
                 else:
-                    df[field.name] = pd.to_numeric(df[field.name], errors='coerce')
+                    values = pd.to_numeric(df[field.name], errors='coerce')
                     if field.mode == 'REQUIRED':
-                        df[field.name] = df[field.name].fillna(0).astype('Int64')
-                    else:
-                        df[field.name] = df[field.name].astype('Int64')
+                        values = values.fillna(0)
+                    coerced[field.name] = values.astype('Int64')
             elif field.field_type == 'FLOAT':
                 if field.name not in df.columns:
-                    df[field.name] = pd.NA if field.mode == 'NULLABLE' else 0.0
+                    coerced[field.name] = pd.NA if field.mode == 'NULLABLE' else 0.0
                 else:
-                    df[field.name] = pd.to_numeric(df[field.name], errors='coerce')
+                    values = pd.to_numeric(df[field.name], errors='coerce')
                     if field.mode == 'REQUIRED':
-                        df[field.name] = df[field.name].fillna(0.0)
+                        values = values.fillna(0.0)
+                    coerced[field.name] = values
             elif field.field_type == 'BOOLEAN':
                 if field.name not in df.columns:
-                    df[field.name] = pd.NA if field.mode == 'NULLABLE' else False
+                    coerced[field.name] = pd.NA if field.mode == 'NULLABLE' else False
                 else:
-                    df[field.name] = df[field.name].fillna(False).astype('boolean')
+                    coerced[field.name] = df[field.name].fillna(False).astype('boolean')
             elif field.field_type == 'STRING':
                 if field.name not in df.columns:
-                    df[field.name] = pd.NA if field.mode == 'NULLABLE' else ''
+                    coerced[field.name] = pd.NA if field.mode == 'NULLABLE' else ''
                 else:
-                    df[field.name] = df[field.name].fillna('').astype(str)
+                    coerced[field.name] = df[field.name].fillna('').astype(str)
+        df = df.assign(**coerced)
+
+        df['created_at'] = df['created_at'].fillna(server_timestamp)
 
         # Debug logging for slots_user_id before upload
-        logging.debug('slots_user_id sample:')
-        logging.debug(f"{df[['slots_user_id']].head(10)}")
-        logging.debug('DataFrame dtypes:')
-        logging.debug(f"{df.dtypes}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug('slots_user_id sample:')
+            logging.debug(f"{df[['slots_user_id']].head(10)}")
+            logging.debug('DataFrame dtypes:')
+            logging.debug(f"{df.dtypes}")
 
         return df
 
+    def _convert_timestamp_column(self, series: pd.Series) -> pd.Series:
+        """Convert a column of Unix timestamps to datetime in one pass.
+        
+        Args:
+            series: Column of raw timestamp values
+            
+        Returns:
+            Datetime series with NaT for missing or invalid values
+        """
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series
+        numeric = pd.to_numeric(series, errors='coerce')
+        if numeric.first_valid_index() is not None or series.first_valid_index() is None:
+            # Zero and negative values are treated as unset
+            return pd.to_datetime(numeric.where(numeric > 0), unit='s', errors='coerce')
+        return pd.to_datetime(series, errors='coerce')
+
     def _convert_types(self, df: pd.DataFrame) -> pd.DataFrame:
         """Convert DataFrame columns to their proper types.
         
@@ -391,14 +422,20 @@ class CrimesEndpointProcessor(BaseEndpointProcessor):
                 logger.info(f"Request URL: {self.endpoint_config['url']}")
                 logger.info(f"Request params: {params}")
                 try:
+                    window_started = time.monotonic()
                     # Use the session from the base class
                     response = self.torn_client.session.get(
                         self.endpoint_config['url'],
                         params=params
                     )
-                    data = response.json()
+                    # Crime windows are the largest payloads we fetch; decode them
+                    # with orjson when it is installed
+                    data = orjson.loads(response.content) if orjson is not None else response.json()
                     logger.info(f"Response status code: {response.status_code}")
-                    logger.info(f"Response data: {data}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        # Rendering a whole window of crimes builds a string as
+                        # large as the parsed response, so only do it on request
+                        logger.debug(f"Response data: {json.dumps(data, separators=(',', ':'))}")
                     # Check for API errors
                     if 'error' in data:
                         error_msg = data['error'].get('error', 'Unknown API error')
@@ -411,26 +448,36 @@ class CrimesEndpointProcessor(BaseEndpointProcessor):
                     if not crimes:
                         logger.info("No crimes found in this time window")
                         break
-                    crime_ids = [crime['id'] for crime in crimes]
-                    logger.info(f"First crime in window: ID {min(crime_ids)}")
-                    logger.info(f"Last crime in window: ID {max(crime_ids)}")
+                    # One pass over the window finds the ID range and merges
+                    # unseen crimes
+                    first_id = last_id = crimes[0]['id']
+                    new_ids = []
+                    for crime in crimes:
+                        crime_id = crime['id']
+                        if crime_id < first_id:
+                            first_id = crime_id
+                        elif crime_id > last_id:
+                            last_id = crime_id
+                        if crime_id not in all_crimes:
+                            all_crimes[crime_id] = crime
+                            new_ids.append(crime_id)
+                    logger.info(f"First crime in window: ID {first_id}")
+                    logger.info(f"Last crime in window: ID {last_id}")
                     logger.info(f"Retrieved {len(crimes)} crimes from window {window_count}")
-                    # Track new crimes added
-                    new_crimes = {str(crime['id']): crime for crime in crimes if str(crime['id']) not in all_crimes}
-                    logger.info(f"Added {len(new_crimes)} new crimes")
-                    if new_crimes:
-                        logger.info(f"New crime IDs: {sorted(map(int, new_crimes.keys()))}")
-                        all_crimes.update(new_crimes)
+                    logger.info(f"Added {len(new_ids)} new crimes")
+                    if new_ids:
+                        logger.info(f"New crime IDs: {sorted(new_ids)}")
                     logger.info(f"Total crimes so far: {len(all_crimes)}")
                     # Move window back in time
                     end_time = start_time
                     window_count += 1
                     # If we didn't add any new crimes, we're done
-                    if not new_crimes:
+                    if not new_ids:
                         logger.info("No new crimes found, stopping time window progression")
                         break
-                    # Add a small delay to avoid hitting rate limits
-                    time.sleep(1)
+                    # Keep windows at least a second apart to avoid hitting rate
+                    # limits, counting the time the request itself took
+                    time.sleep(max(0.0, window_started + 1 - time.monotonic()))
                 except Exception as e:
                     logger.error(f"Error fetching crimes data: {str(e)}")
                     break
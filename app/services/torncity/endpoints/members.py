@@ -120,7 +120,6 @@ class MembersEndpointProcessor(BaseEndpointProcessor):
 
                 # Create member record
                 member_record = {
-                    'server_timestamp': server_timestamp,
                     'id': int(member.get('id', 0)),
                     'name': str(member.get('name', 'Unknown')),
                     'level': int(member.get('level', 0)),
@@ -153,30 +152,35 @@ class MembersEndpointProcessor(BaseEndpointProcessor):
             return pd.DataFrame(columns=[field.name for field in self.get_schema()])
 
         df = pd.DataFrame(transformed_data)
+        # Broadcast the fetch time as a scalar rather than copying it into every row
+        df.insert(0, 'server_timestamp', server_timestamp)
         
-        # Convert types to match schema
+        # Convert types to match schema, collecting the columns so the frame
+        # is rebuilt once instead of on every assignment
+        coerced: Dict[str, Any] = {}
         for field in self.get_schema():
             if field.field_type == 'TIMESTAMP':
                 if field.name not in df.columns:
-                    df[field.name] = pd.NaT
+                    coerced[field.name] = pd.NaT
                 else:
-                    df[field.name] = pd.to_datetime(df[field.name], errors='coerce')
+                    values = pd.to_datetime(df[field.name], errors='coerce')
                     if field.mode == 'REQUIRED':
-                        df[field.name] = df[field.name].fillna(pd.Timestamp.now())
+                        values = values.fillna(pd.Timestamp.now())
+                    coerced[field.name] = values
             elif field.field_type == 'INTEGER':
                 if field.name not in df.columns:
-                    df[field.name] = pd.NA if field.mode == 'NULLABLE' else 0
+                    coerced[field.name] = pd.NA if field.mode == 'NULLABLE' else 0
                 else:
-                    df[field.name] = pd.to_numeric(df[field.name], errors='coerce')
+                    values = pd.to_numeric(df[field.name], errors='coerce')
                     if field.mode == 'REQUIRED':
-                        df[field.name] = df[field.name].fillna(0).astype('Int64')
-                    else:
-                        df[field.name] = df[field.name].astype('Int64')
+                        values = values.fillna(0)
+                    coerced[field.name] = values.astype('Int64')
             elif field.field_type == 'STRING':
                 if field.name not in df.columns:
-                    df[field.name] = pd.NA if field.mode == 'NULLABLE' else ''
+                    coerced[field.name] = pd.NA if field.mode == 'NULLABLE' else ''
                 else:
-                    df[field.name] = df[field.name].fillna('').astype(str)
+                    coerced[field.name] = df[field.name].fillna('').astype(str)
+        df = df.assign(**coerced)
 
         return df
 
@@ -198,7 +202,8 @@ class MembersEndpointProcessor(BaseEndpointProcessor):
                 return pd.DataFrame()
             
             # Log raw API response
-            logging.info(f"Raw API response: {data}")
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(f"Raw API response: {data}")
             
             # Transform data to DataFrame
             df = self.transform_data(data)
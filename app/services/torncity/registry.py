@@ -9,7 +9,6 @@ import importlib
 import inspect
 import logging
 import pkgutil
-import re
 from typing import Dict, Type, Optional
 
 from app.services.torncity.base import BaseEndpointProcessor
@@ -7,10 +7,20 @@ crontab entries for each endpoint using only standard library functions.
 
 import json
 import os
-import re
+import subprocess
+import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+# Cron expressions for durations with a conventional schedule
+_COMMON_SCHEDULES = {
+    1440: "0 0 * * *",  # Daily
+    720: "0 */12 * * *",  # 12 hours
+    60: "0 * * * *",  # Hourly
+}
+
+@lru_cache(maxsize=128)
 def parse_iso_duration(duration: str) -> int:
     """Parse ISO 8601 duration string into minutes.
     
@@ -19,24 +29,44 @@ def parse_iso_duration(duration: str) -> int:
         
     Returns:
         int: Duration in minutes
+        
+    Raises:
+        ValueError: If the duration string is invalid or is not a whole
+            number of minutes
     """
-    # Extract numbers and units using regex
-    pattern = r'P(?:(\d+)D)?T?(?:(\d+)H)?(?:(\d+)M)?'
-    match = re.match(pattern, duration)
-    if not match:
+    if not duration or duration[0] != 'P':
         raise ValueError(f"Invalid duration format: {duration}")
     
-    days, hours, minutes = match.groups()
-    total_minutes = 0
+    # Single forward scan: accumulate digits, dispatch on each designator.
+    # Days come before 'T'; hours, minutes and seconds follow it in order.
+    units = 'D'
+    seconds_per_unit = (24 * 60 * 60,)
+    unit_pos = 0
+    total_seconds = 0
+    num = None
+    for c in duration[1:]:
+        if '0' <= c <= '9':
+            num = (num or 0) * 10 + (ord(c) - 48)
+            continue
+        if c == 'T' and units == 'D' and num is None:
+            units = 'HMS'
+            seconds_per_unit = (60 * 60, 60, 1)
+            unit_pos = 0
+            continue
+        pos = units.find(c, unit_pos)
+        if pos < 0 or num is None:
+            raise ValueError(f"Invalid duration format: {duration}")
+        total_seconds += num * seconds_per_unit[pos]
+        unit_pos = pos + 1
+        num = None
     
-    if days:
-        total_minutes += int(days) * 24 * 60
-    if hours:
-        total_minutes += int(hours) * 60
-    if minutes:
-        total_minutes += int(minutes)
+    if num is not None or duration[-1] in 'PT':
+        raise ValueError(f"Invalid duration format: {duration}")
+    # Cron schedules whole minutes, so seconds must add up to one
+    if total_seconds % 60:
+        raise ValueError(f"Duration must be a whole number of minutes: {duration}")
         
-    return total_minutes
+    return total_seconds // 60
 
 def duration_to_cron(minutes: int) -> str:
     """Convert duration in minutes to cron schedule expression.
@@ -46,23 +76,27 @@ def duration_to_cron(minutes: int) -> str:
         
     Returns:
         str: Cron schedule expression
+        
+    Raises:
+        ValueError: If cron cannot run at exactly this interval, i.e. it
+            does not divide an hour or a day evenly
     """
     if minutes < 1:
         raise ValueError("Duration must be at least 1 minute")
     
-    if minutes == 1440:  # Daily
-        return "0 0 * * *"
-    elif minutes == 720:  # 12 hours
-        return "0 */12 * * *"
-    elif minutes == 60:  # Hourly
-        return "0 * * * *"
-    elif minutes < 60:  # Minutes
+    if minutes in _COMMON_SCHEDULES:
+        return _COMMON_SCHEDULES[minutes]
+    # Cron steps restart at every hour and day boundary, so only intervals
+    # that divide them evenly repeat at a fixed rate
+    if minutes < 60 and 60 % minutes == 0:  # Minutes
         return f"*/{minutes} * * * *"
-    else:  # Convert to hours if possible
-        hours = minutes / 60
-        if hours.is_integer():
-            return f"0 */{int(hours)} * * *"
-        return f"*/{minutes} * * *"
+    hours, remainder = divmod(minutes, 60)
+    if remainder == 0 and 24 % hours == 0:  # Hours
+        return f"0 */{hours} * * *"
+    raise ValueError(
+        f"Cannot schedule an interval of {minutes} minutes with cron: "
+        "it must divide an hour or a day evenly"
+    )
 
 def main():
     """Generate crontab entries for all endpoints."""
@@ -87,7 +121,14 @@ def main():
         ""
     ]
     
+    # Only the endpoint name varies between jobs, so build the command once
+    cmd_template = (
+        f"cd {app_dir} && {scripts_dir}/setup.py main --endpoint %(name)s "
+        f"--config-dir {config_dir} >> {log_dir}/%(name)s.log 2>&1"
+    )
+    
     # Add jobs for each endpoint
+    skipped = []
     for endpoint in config.get("endpoints", []):
         name = endpoint["name"]
         frequency = endpoint.get("frequency", "PT15M")
@@ -97,11 +138,11 @@ def main():
             schedule = duration_to_cron(minutes)
             
             # Create the cron command with environment setup and config directory
-            cmd = f"cd {app_dir} && {scripts_dir}/setup.py main --endpoint {name} --config-dir {config_dir} >> {log_dir}/{name}.log 2>&1"
-            cron_jobs.append(f"{schedule} {cmd}")
+            cron_jobs.append(f"{schedule} {cmd_template % {'name': name}}")
             
         except Exception as e:
-            print(f"Error processing endpoint {name}: {e}")
+            print(f"Error processing endpoint {name}: {e}", file=sys.stderr)
+            skipped.append(name)
     
     # Write crontab to standard location
     crontab_user = os.environ.get("CRON_USER", "tcdatalogger")
@@ -110,18 +151,19 @@ def main():
     # Ensure proper permissions
     crontab_content = "\n".join(cron_jobs) + "\n"
     
-    # Write to a temporary file first
-    temp_file = Path("/tmp/crontab.tmp")
-    with open(temp_file, "w") as f:
-        f.write(crontab_content)
-    
-    # Use crontab command to install (handles permissions correctly)
-    os.system(f"crontab -u {crontab_user} {temp_file}")
-    
-    # Cleanup
-    temp_file.unlink()
+    # Pipe the entries straight to crontab (handles permissions correctly)
+    subprocess.run(
+        ["crontab", "-u", crontab_user, "-"],
+        input=crontab_content,
+        text=True,
+        check=True
+    )
     
     print(f"Installed crontab for user: {crontab_user}")
+    
+    # A skipped endpoint never runs, so fail rather than let it go unnoticed
+    if skipped:
+        sys.exit(f"No cron job installed for endpoints: {', '.join(skipped)}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
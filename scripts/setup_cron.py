@@ -8,12 +8,12 @@ This script:
 """
 
 import json
-import os
 import sys
 import logging
 from pathlib import Path
 import subprocess
 import isodate
+from functools import lru_cache
 from typing import Dict, List
 
 # Configure logging
@@ -31,18 +31,42 @@ def load_api_config(config_file: str) -> Dict:
         logging.error(f"Failed to load API config: {e}")
         sys.exit(1)
 
+# Cron schedules for the frequencies endpoints normally use
+_DURATION_TO_CRON = {
+    "PT1M": "*/1 * * * *",
+    "PT5M": "*/5 * * * *",
+    "PT10M": "*/10 * * * *",
+    "PT15M": "*/15 * * * *",
+    "PT30M": "*/30 * * * *",
+    "PT1H": "0 * * * *",
+    "PT12H": "0 */12 * * *",
+    "P1D": "0 0 * * *",
+}
+
+@lru_cache(maxsize=64)
 def iso_duration_to_cron(duration: str) -> str:
     """Convert ISO 8601 duration to cron schedule.
     
+    Common frequencies come straight from a lookup table; anything else is
+    parsed with isodate. Results are cached, since many endpoints share the
+    same frequency.
+    
     Args:
         duration: ISO duration string (e.g., "PT15M", "PT1H", "P1D")
         
     Returns:
-        str: Cron schedule expression
+        str: Cron schedule expression, or None if the duration is invalid or
+            does not divide an hour or a day evenly
     """
+    if duration in _DURATION_TO_CRON:
+        return _DURATION_TO_CRON[duration]
+    
     try:
         td = isodate.parse_duration(duration)
-        minutes = int(td.total_seconds() / 60)
+        seconds = td.total_seconds()
+        if seconds % 60:
+            raise ValueError("Duration must be a whole number of minutes")
+        minutes = int(seconds // 60)
         
         if minutes < 1:
             raise ValueError("Duration must be at least 1 minute")
@@ -53,13 +77,17 @@ def iso_duration_to_cron(duration: str) -> str:
             return "0 */12 * * *"
         elif minutes == 60:  # Hourly
             return "0 * * * *"
-        elif minutes < 60:  # Minutes
+        # Cron steps restart at every hour and day boundary, so only intervals
+        # that divide them evenly repeat at a fixed rate
+        if minutes < 60 and 60 % minutes == 0:  # Minutes
             return f"*/{minutes} * * * *"
-        else:  # Convert to hours if possible
-            hours = minutes / 60
-            if hours.is_integer():
-                return f"0 */{int(hours)} * * *"
-            return f"*/{minutes} * * *"
+        hours, remainder = divmod(minutes, 60)
+        if remainder == 0 and 24 % hours == 0:  # Hours
+            return f"0 */{hours} * * *"
+        raise ValueError(
+            f"Cannot schedule an interval of {minutes} minutes with cron: "
+            "it must divide an hour or a day evenly"
+        )
             
     except Exception as e:
         logging.error(f"Failed to parse duration {duration}: {e}")
@@ -79,6 +107,12 @@ def generate_cron_jobs(workspace_dir: Path, config: Dict) -> List[str]:
         ""
     ])
     
+    # Only the endpoint name varies between jobs, so build the command once
+    cmd_template = (
+        f"cd {workspace_dir} && ./scripts/setup.py main --endpoint %(name)s "
+        f">> {workspace_dir}/logs/%(name)s.log 2>&1"
+    )
+    
     # Add jobs for each endpoint
     for endpoint in config.get("endpoints", []):
         name = endpoint["name"]
@@ -87,27 +121,27 @@ def generate_cron_jobs(workspace_dir: Path, config: Dict) -> List[str]:
         
         if schedule:
             # Create the cron command
-            cmd = f"cd {workspace_dir} && ./scripts/setup.py main --endpoint {name} >> {workspace_dir}/logs/{name}.log 2>&1"
-            cron_jobs.append(f"{schedule} {cmd}")
+            cron_jobs.append(f"{schedule} {cmd_template % {'name': name}}")
+        else:
+            # Reported per endpoint, since cached failures are only logged once
+            logging.error(f"Skipping endpoint {name}: no cron schedule for {frequency}")
     
     return cron_jobs
 
 def setup_cron_jobs(cron_jobs: List[str]) -> None:
     """Install the cron jobs."""
     try:
-        # Write cron jobs to temporary file
-        temp_file = "/tmp/tcdatalogger_cron"
-        with open(temp_file, "w") as f:
-            f.write("\n".join(cron_jobs) + "\n")
-        
-        # Install cron jobs
-        result = subprocess.run(["crontab", temp_file], capture_output=True, text=True)
+        # Install cron jobs, piping them to crontab instead of a temporary file
+        result = subprocess.run(
+            ["crontab", "-"],
+            input="\n".join(cron_jobs) + "\n",
+            capture_output=True,
+            text=True
+        )
         if result.returncode != 0:
             logging.error(f"Failed to install cron jobs: {result.stderr}")
             sys.exit(1)
         
-        # Clean up
-        os.unlink(temp_file)
         logging.info("Successfully installed cron jobs")
         
     except Exception as e:
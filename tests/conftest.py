@@ -144,6 +144,22 @@ def mock_google_auth(monkeypatch):
     monkeypatch.setattr('os.path.exists', mock_exists)
     return mock_creds
 
+@pytest.fixture(autouse=True)
+def clear_bigquery_client_cache():
+    """Keep cached BigQuery clients from leaking mocks between tests."""
+    from app.services.google.bigquery.client import _load_client
+    _load_client.cache_clear()
+    yield
+    _load_client.cache_clear()
+
+@pytest.fixture(autouse=True)
+def clear_api_keys_cache():
+    """Keep API key files parsed in one test from leaking into the next."""
+    from app.core.common import _read_api_keys_file
+    _read_api_keys_file.cache_clear()
+    yield
+    _read_api_keys_file.cache_clear()
+
 @pytest.fixture
 def mock_bigquery_client():
     """Mock BigQuery client for testing."""
@@ -6,6 +6,7 @@ import pytest
 import tempfile
 import logging
 from datetime import timedelta
+from app.core import common
 from app.core.common import (
     setup_logging,
     find_config_directory,
@@ -108,6 +109,8 @@ class TestDurationParsing:
         "P1H",  # Time designator in wrong place
         "PT1X",  # Invalid designator
         None,  # Not a string
+        ["PT15M"],  # Unhashable, not a string
+        {"frequency": "PT15M"},  # Unhashable, not a string
         "P0D",  # Zero duration
     ])
     def test_invalid_durations(self, invalid_duration):
@@ -118,6 +121,13 @@ class TestDurationParsing:
 class TestPolling:
     """Test suite for polling functionality."""
     
+    @pytest.fixture(autouse=True)
+    def clear_poll_deadlines(self):
+        """Keep poll deadlines recorded in one test from leaking into the next."""
+        common._poll_deadlines.clear()
+        yield
+        common._poll_deadlines.clear()
+    
     def test_wait_for_next_poll(self, mocker):
         """Test wait_for_next_poll function."""
         # Mock time.sleep to avoid actual waiting
@@ -139,6 +149,27 @@ class TestPolling:
         # Test invalid frequency format
         with pytest.raises(ValueError):
             wait_for_next_poll({"name": "test", "frequency": "1M"})
+    
+    def test_wait_for_next_poll_no_drift(self, mocker):
+        """Test that processing time is deducted from the next wait."""
+        # Replace only the clock seen by app.core.common
+        mock_time = mocker.patch.object(common, 'time')
+        mock_time.monotonic.side_effect = [100.0, 175.0, 400.0]
+        mock_sleep = mock_time.sleep
+        api_config = {"name": "drift_test", "frequency": "PT1M"}
+        
+        # First poll waits the full interval; deadline is 160
+        wait_for_next_poll(api_config)
+        mock_sleep.assert_called_with(60)
+        
+        # 15 seconds of processing after the deadline leaves 45 to wait
+        wait_for_next_poll(api_config)
+        mock_sleep.assert_called_with(45.0)
+        
+        # An overdue poll runs immediately
+        mock_sleep.reset_mock()
+        wait_for_next_poll(api_config)
+        mock_sleep.assert_not_called()
 
 class TestCommonUtilities:
     """Test suite for common utilities."""
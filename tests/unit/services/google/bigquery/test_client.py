@@ -1,4 +1,6 @@
 import pytest
+import numpy as np
+import pandas as pd
 from unittest.mock import Mock, patch
 from google.cloud import bigquery
 from google.api_core import exceptions
@@ -223,4 +225,74 @@ def test_write_data_in_batches(bq_client, mock_bigquery_client):
     bq_client.write_data_in_batches(data, 'test_table', batch_size=1000)
     
     # Should have made 3 calls (2 full batches + 1 partial)
-    assert mock_bigquery_client.return_value.load_table_from_dataframe.call_count == 3 
\ No newline at end of file
+    assert mock_bigquery_client.return_value.load_table_from_dataframe.call_count == 3 
+
+@pytest.fixture
+def loaded_client(mocker):
+    """BigQueryClient built on a mocked google.cloud.bigquery.Client."""
+    mock_credentials = Mock(project_id='test-project')
+    mock_client = Mock()
+    mocker.patch(
+        'app.services.google.bigquery.client._load_client',
+        return_value=(mock_credentials, mock_client)
+    )
+    return BigQueryClient('credentials.json'), mock_client
+
+def test_upload_dataframe_single_load_job(loaded_client):
+    """Test that large frames are uploaded atomically in one load job."""
+    client, mock_client = loaded_client
+    df = pd.DataFrame({'col1': range(60_000)})
+    client.upload_dataframe(df, 'project.dataset.table', write_disposition='WRITE_TRUNCATE')
+    
+    mock_client.load_table_from_dataframe.assert_called_once()
+    args, kwargs = mock_client.load_table_from_dataframe.call_args
+    assert len(args[0]) == 60_000
+    assert kwargs['job_config'].write_disposition == 'WRITE_TRUNCATE'
+
+def test_write_data_appends_with_existing_table_schema(loaded_client):
+    """Test that appends follow the existing table's field modes."""
+    client, mock_client = loaded_client
+    table_schema = [bigquery.SchemaField('col1', 'STRING', mode='NULLABLE')]
+    mock_client.get_table.return_value = Mock(schema=table_schema)
+    
+    declared = [bigquery.SchemaField('col1', 'STRING', mode='REQUIRED')]
+    client.write_data([{'col1': 'a'}], 'project.dataset.table', schema=declared)
+    
+    job_config = mock_client.load_table_from_dataframe.call_args[1]['job_config']
+    assert job_config.schema[0].mode == 'NULLABLE'
+
+def test_write_data_uses_declared_schema_for_missing_table(loaded_client):
+    """Test that a missing table is created with the declared schema."""
+    client, mock_client = loaded_client
+    mock_client.get_table.side_effect = exceptions.NotFound('not found')
+    
+    declared = [bigquery.SchemaField('col1', 'STRING', mode='REQUIRED')]
+    client.write_data([{'col1': 'a'}], 'project.dataset.table', schema=declared)
+    
+    job_config = mock_client.load_table_from_dataframe.call_args[1]['job_config']
+    assert job_config.schema[0].mode == 'REQUIRED'
+
+def test_write_data_in_batches_empty_missing_table(loaded_client):
+    """Test that empty input for a missing table raises BigQueryError."""
+    client, mock_client = loaded_client
+    mock_client.get_table.side_effect = exceptions.NotFound('not found')
+    
+    with pytest.raises(BigQueryError, match="Cannot create table without data or schema"):
+        client.write_data_in_batches([], 'project.dataset.table')
+    mock_client.load_table_from_dataframe.assert_not_called()
+
+def test_write_data_in_batches_empty_existing_table(loaded_client):
+    """Test that empty input for an existing table is a no-op."""
+    client, mock_client = loaded_client
+    
+    client.write_data_in_batches([], 'project.dataset.table')
+    mock_client.load_table_from_dataframe.assert_not_called()
+
+def test_validate_field_modes_repeated_items_checked_by_identity(loaded_client):
+    """Test that only None items fail a REPEATED field, not NA-like values."""
+    client, _ = loaded_client
+    schema = [bigquery.SchemaField('tags', 'STRING', mode='REPEATED')]
+    
+    client.validate_field_modes([{'tags': [pd.NA, np.array([1, 2]), 'a']}], schema)
+    with pytest.raises(ValueError, match="item 1 cannot be null"):
+        client.validate_field_modes([{'tags': [np.array([1, 2]), None]}], schema)
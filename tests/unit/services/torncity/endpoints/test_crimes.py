@@ -7,6 +7,7 @@ from app.services.torncity.endpoints.crimes import CrimesEndpointProcessor
 import json
 import os
 import pathlib
+import time
 
 @pytest.fixture
 def sample_crimes_response():
@@ -281,4 +282,32 @@ def test_crimes_processor_slots_user_id(monkeypatch, tmp_path):
     assert df.loc[df['slots_position'] == 'hacker', 'slots_user_id'].iloc[0] == 222
     # For the slot with user=None, should be pd.NA or None
     driver_val = df.loc[df['slots_position'] == 'driver', 'slots_user_id'].iloc[0]
-    assert pd.isna(driver_val) or driver_val is None 
\ No newline at end of file
+    assert pd.isna(driver_val) or driver_val is None 
+
+@pytest.fixture
+def non_utc_timezone(monkeypatch):
+    """Run the test with the process local time zone set to New York."""
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+def test_server_timestamp_is_utc(non_utc_timezone, mock_api_keys):
+    """Test that fill-in timestamps are UTC like the converted epoch columns."""
+    config = {
+        "endpoint": "v2/faction/crimes",
+        "table": "project.dataset.crimes",
+        "frequency": "PT15M",
+        "gcp_credentials_file": "config/credentials.json.example",
+        "tc_api_key_file": mock_api_keys
+    }
+    processor = CrimesEndpointProcessor(config)
+    response = {"crimes": [{"id": 1, "name": "Test Crime", "status": "planning", "slots": []}]}
+    
+    before = pd.Timestamp.now(tz="UTC").tz_localize(None)
+    df = processor.transform_data(response)
+    after = pd.Timestamp.now(tz="UTC").tz_localize(None)
+    
+    assert before <= df["server_timestamp"].iloc[0] <= after
+    assert before <= df["created_at"].iloc[0] <= after
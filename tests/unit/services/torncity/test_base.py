@@ -7,7 +7,8 @@ from google.cloud import bigquery
 import pandas as pd
 from typing import Dict, List, Any
 
-from app.services.torncity.base import BaseEndpointProcessor
+from app.services.torncity.base import BaseEndpointProcessor, SchemaValidator
+from app.services.torncity.exceptions import DataValidationError
 from app.services.torncity.client import TornClient
 from app.services.google.bigquery.client import BigQueryClient
 
@@ -134,6 +135,21 @@ class TestBaseProcessor:
         assert not result.empty
         assert all(col in result.columns for col in ['id', 'name', 'timestamp', 'value'])
 
+    def test_validate_schema_keeps_nullable_string_nulls(self, processor):
+        """Test that NULLs in a NULLABLE STRING column are not filled."""
+        df = pd.DataFrame({
+            'id': [1, 2, 3],
+            'name': pd.Series(['a', None, 'b'], dtype=object),
+            'timestamp': ['2025-03-17T10:00:00'] * 3,
+            'value': [1.0, 2.0, 3.0]
+        })
+        
+        processor.validate_schema(df)
+        
+        assert df['name'].iloc[0] == 'a'
+        assert pd.isna(df['name'].iloc[1])
+        assert df['name'].iloc[2] == 'b'
+
     @patch.object(TornClient, "make_request")
     @patch.object(BigQueryClient, "write_data")
     def test_run_processor(self, mock_write, mock_request, processor, sample_bigquery_schema):
@@ -217,4 +233,30 @@ class TestBaseProcessor:
         
         # Verify the other arguments
         assert mock_write.call_args[0][1] == 'test_table'
-        assert mock_write.call_args[1]['write_disposition'] == 'WRITE_APPEND' 
\ No newline at end of file
+        assert mock_write.call_args[1]['write_disposition'] == 'WRITE_APPEND' 
+
+class TestSchemaValidator:
+    """Test cases for SchemaValidator column conversion."""
+    
+    @pytest.fixture
+    def validator(self):
+        """Validator with a single nullable FLOAT field."""
+        return SchemaValidator([bigquery.SchemaField('value', 'FLOAT', 'NULLABLE')])
+    
+    def test_float_accepts_python_float_spellings(self, validator):
+        """Test that strings float() accepts are converted, not rejected."""
+        df = pd.DataFrame({'value': ['1.5', 'nan', '1_000', None]})
+        
+        result = validator.validate_dataframe(df)['value']
+        
+        assert result.iloc[0] == 1.5
+        assert pd.isna(result.iloc[1])
+        assert result.iloc[2] == 1000.0
+        assert pd.isna(result.iloc[3])
+    
+    def test_float_rejects_invalid_string(self, validator):
+        """Test that strings float() rejects raise DataValidationError."""
+        df = pd.DataFrame({'value': ['1.5', 'abc']})
+        
+        with pytest.raises(DataValidationError, match="could not convert 'abc' to float"):
+            validator.validate_dataframe(df)